@@ -19,6 +19,12 @@ if [ ! -f "sbdk_config.json" ]; then
     exit 1
 fi
 
+# Copy a database file, sharing data blocks (copy-on-write) where the
+# filesystem supports it; cp without --reflink (BSD/macOS) falls back to a
+# plain copy. Hardlinks are not used: DuckDB updates files in place, so a
+# linked "backup" would change along with the original.
+copy_db() { cp --reflink=auto "$1" "$2" 2>/dev/null || cp "$1" "$2"; }
+
 # Create backups directory
 echo "📁 Creating backups directory..."
 mkdir -p data/backups
@@ -27,41 +33,42 @@ mkdir -p data/backups
 echo "💾 Creating backups of original database files..."
 
 if [ -f "data/demo_project.duckdb" ]; then
-    cp data/demo_project.duckdb data/backups/backup_demo_project.duckdb
+    copy_db data/demo_project.duckdb data/backups/backup_demo_project.duckdb
     echo "   ✅ Backed up: demo_project.duckdb"
 else
     echo "   ⚠️  Warning: demo_project.duckdb not found"
 fi
 
 if [ -f "data/dev.duckdb" ]; then
-    cp data/dev.duckdb data/backups/backup_dev.duckdb
+    copy_db data/dev.duckdb data/backups/backup_dev.duckdb
     echo "   ✅ Backed up: dev.duckdb"
 else
     echo "   ⚠️  Warning: dev.duckdb not found"
 fi
 
 if [ -f "sample.duckdb" ]; then
-    cp sample.duckdb data/backups/backup_sample.duckdb
+    copy_db sample.duckdb data/backups/backup_sample.duckdb
     echo "   ✅ Backed up: sample.duckdb"
 else
     echo "   ⚠️  Warning: sample.duckdb not found"
 fi
 
-# Create optimized copies with descriptive names
+# Create optimized copies with descriptive names. They are made from the
+# backups just taken, so all copies share blocks with one snapshot
 echo "✨ Creating optimized database files..."
 
 if [ -f "data/demo_project.duckdb" ]; then
-    cp data/demo_project.duckdb data/starter-database.duckdb
+    copy_db data/backups/backup_demo_project.duckdb data/starter-database.duckdb
     echo "   🚀 Created: starter-database.duckdb (clean starting point)"
 fi
 
 if [ -f "data/dev.duckdb" ]; then
-    cp data/dev.duckdb data/development-database.duckdb
+    copy_db data/backups/backup_dev.duckdb data/development-database.duckdb
     echo "   🔧 Created: development-database.duckdb (for development)"
 fi
 
 if [ -f "sample.duckdb" ]; then
-    cp sample.duckdb data/sample-data-database.duckdb
+    copy_db data/backups/backup_sample.duckdb data/sample-data-database.duckdb
     echo "   📋 Created: sample-data-database.duckdb (with example data)"
 fi
 
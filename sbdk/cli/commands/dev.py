@@ -15,9 +15,14 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
+from sbdk.core.project import DEFAULT_PIPELINES
+
 # Initialize console for rich output
 console = Console()
 
+# Only Python, SQL, and YAML changes trigger a rerun
+WATCHED_SUFFIXES = (".py", ".sql", ".yml", ".yaml")
+
 # Create the dev command
 cli_dev = typer.Typer(
     name="dev", help="🔧 Execute pipeline in development mode with hot reload"
@@ -36,10 +41,7 @@ class DevFileHandler(FileSystemEventHandler):
         if event.is_directory:
             return
 
-        # Only watch Python, SQL, and YAML files
-        if any(
-            event.src_path.endswith(ext) for ext in [".py", ".sql", ".yml", ".yaml"]
-        ):
+        if event.src_path.endswith(WATCHED_SUFFIXES):
             current_time = time.time()
             if current_time - self.last_triggered > self.debounce_seconds:
                 self.last_triggered = current_time
@@ -101,11 +103,13 @@ def execute_pipeline(
             TextColumn("[progress.description]{task.description}"),
             console=console,
         ) as progress:
-            task = progress.add_task("[cyan]Running pipelines...", total=3)
+            task = progress.add_task(
+                "[cyan]Running pipelines...", total=len(DEFAULT_PIPELINES)
+            )
 
             pipelines_dir = Path("pipelines")
             if pipelines_dir.exists():
-                for pipeline in ["users", "events", "orders"]:
+                for pipeline in DEFAULT_PIPELINES:
                     module_path = pipelines_dir / f"{pipeline}.py"
                     if module_path.exists():
                         run_pipeline_module(module_path, pipeline)
@@ -3,6 +3,7 @@ Project initialization commands
 """
 
 import json
+import re
 import shutil
 from pathlib import Path
 from typing import Optional
@@ -14,6 +15,9 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 console = Console()
 
+# Template placeholders in dbt_project.yml that are replaced by the project name
+PROJECT_NAME_PATTERN = re.compile(r"\{project_name\}|sbdk_project")
+
 
 def cli_init(
     project_name: str = typer.Argument(
@@ -67,9 +71,8 @@ def cli_init(
             with open(dbt_project_path) as f:
                 content = f.read()
 
-            # Replace template placeholders with actual project name
-            content = content.replace("{project_name}", project_name)
-            content = content.replace("sbdk_project", project_name)
+            # Replace template placeholders with actual project name in one pass
+            content = PROJECT_NAME_PATTERN.sub(lambda _: project_name, content)
 
             with open(dbt_project_path, "w") as f:
                 f.write(content)
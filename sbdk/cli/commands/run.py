@@ -22,6 +22,8 @@ from rich.progress import (
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
+from sbdk.core.project import DEFAULT_PIPELINES
+
 console = Console()
 
 
@@ -89,10 +91,11 @@ def execute_pipeline(
 
         if not dbt_only:
             # Run data pipelines
-            pipelines_task = progress.add_task("Running data pipelines...", total=3)
+            pipelines_task = progress.add_task(
+                "Running data pipelines...", total=len(DEFAULT_PIPELINES)
+            )
 
-            pipeline_modules = ["users", "events", "orders"]
-            for _i, module in enumerate(pipeline_modules):
+            for module in DEFAULT_PIPELINES:
                 progress.update(
                     pipelines_task, description=f"Running {module} pipeline..."
                 )
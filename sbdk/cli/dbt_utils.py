@@ -11,6 +11,8 @@ import sys
 from pathlib import Path
 from typing import Optional, Union
 
+SCRIPT_DIR = Path(__file__).parent
+
 
 def find_dbt_executable() -> str:
     """
@@ -64,11 +66,8 @@ def prepare_dbt_env(extra_env: Optional[dict[str, str]] = None) -> dict[str, str
     Returns:
         Dictionary of environment variables
     """
-    env = os.environ.copy()
-
-    # Ensure HOME is set for proper ~ expansion
-    if "HOME" not in env:
-        env["HOME"] = str(Path.home())
+    # Ensure HOME is set for proper ~ expansion; an inherited HOME wins
+    env = {"HOME": str(Path.home()), **os.environ}
 
     # Handle DBT_PROFILES_DIR with proper path expansion
     profiles_dir = env.get("DBT_PROFILES_DIR", "~/.dbt")
@@ -127,10 +126,9 @@ def build_dbt_command(
         project_path = Path(project_dir).resolve()
     else:
         # Try to find dbt directory relative to script (adjusted for sbdk-starter structure)
-        script_dir = Path(__file__).parent
         potential_paths = [
-            script_dir.parent / "dbt",  # sbdk-starter/dbt
-            script_dir.parent.parent / "dbt",  # parent/dbt
+            SCRIPT_DIR.parent / "dbt",  # sbdk-starter/dbt
+            SCRIPT_DIR.parent.parent / "dbt",  # parent/dbt
             Path.cwd() / "dbt",
             Path.cwd(),
         ]
@@ -318,10 +316,9 @@ class DbtRunner:
             return Path(project_dir).resolve()
 
         # Try to find dbt directory relative to script (sbdk-starter structure)
-        script_dir = Path(__file__).parent
         potential_paths = [
-            script_dir.parent / "dbt",  # sbdk-starter/dbt
-            script_dir.parent.parent / "dbt",  # parent/dbt
+            SCRIPT_DIR.parent / "dbt",  # sbdk-starter/dbt
+            SCRIPT_DIR.parent.parent / "dbt",  # parent/dbt
             Path.cwd() / "dbt",
             Path.cwd(),
         ]
@@ -17,6 +17,9 @@ from .dbt_utils import DbtRunner, find_dbt_executable
 
 console = Console()
 
+# Config keys whose values are filesystem paths worth checking
+PATH_KEYS = frozenset({"dbt_path", "profiles_dir", "duckdb_path"})
+
 
 def cli_debug(
     config_file: str = typer.Option("sbdk_config.json", help="Config file path"),
@@ -74,7 +77,7 @@ def cli_debug(
 
                 # Check if paths exist
                 status = "✅"
-                if key in ["dbt_path", "profiles_dir", "duckdb_path"]:
+                if key in PATH_KEYS:
                     path = Path(str(value))
                     if key == "duckdb_path":
                         # Check if parent directory exists for database files
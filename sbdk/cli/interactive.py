@@ -57,10 +57,14 @@ class SBDKInteractive:
         
         # Check database
         db_path = self.project_path / self.config.get("duckdb_path", "data/dev.duckdb")
+        try:
+            db_size = db_path.stat().st_size
+        except (FileNotFoundError, NotADirectoryError):
+            db_size = None
         status["database"] = {
-            "exists": db_path.exists(),
+            "exists": db_size is not None,
             "path": str(db_path),
-            "size": f"{db_path.stat().st_size / (1024*1024):.1f} MB" if db_path.exists() else "0 MB"
+            "size": f"{db_size / (1024*1024):.1f} MB" if db_size is not None else "0 MB"
         }
         
         # Check pipelines
@@ -187,9 +187,47 @@ class FastAPIClient:
         await self.client.aclose()
 
 
+# Directories never worth watching: VCS metadata, environments, caches and dbt output
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        ".tox",
+        ".mypy_cache",
+        ".pytest_cache",
+        "target",
+        "dbt_packages",
+        "build",
+        "dist",
+    }
+)
+
+
+def _walk(root: str):
+    """Yield file paths under root using a single os.scandir traversal"""
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+
+
 class FileWatcher:
     """File system watcher for auto-run functionality"""
 
+    watched_suffixes = (".py", ".sql")
+
     def __init__(self, paths: list[str], callback: Callable[[str], None]):
         self.paths = paths
         self.callback = callback
@@ -211,6 +249,15 @@ class FileWatcher:
         if self.thread:
             self.thread.join(timeout=1.0)
 
+    def _iter_watched_files(self, path_str: str):
+        """Lazily yield watched files under path_str, or path_str itself if a file"""
+        if os.path.isfile(path_str):
+            yield path_str
+            return
+        for file_path in _walk(path_str):
+            if file_path.endswith(self.watched_suffixes):
+                yield file_path
+
     def _watch_loop(self):
         """Main file watching loop (simplified implementation)"""
         last_modified = {}
@@ -220,19 +267,14 @@ class FileWatcher:
                 for path_str in self.paths:
                     path = Path(path_str)
                     if path.exists():
-                        if path.is_file():
-                            files = [path]
-                        else:
-                            files = list(path.rglob("*.py")) + list(path.rglob("*.sql"))
-
-                        for file_path in files:
+                        for file_path in self._iter_watched_files(path_str):
                             try:
-                                mtime = file_path.stat().st_mtime
-                                if str(file_path) not in last_modified:
-                                    last_modified[str(file_path)] = mtime
-                                elif mtime > last_modified[str(file_path)]:
-                                    last_modified[str(file_path)] = mtime
-                                    self.callback(str(file_path))
+                                mtime = os.stat(file_path).st_mtime
+                                if file_path not in last_modified:
+                                    last_modified[file_path] = mtime
+                                elif mtime > last_modified[file_path]:
+                                    last_modified[file_path] = mtime
+                                    self.callback(file_path)
                             except:
                                 continue
 
@@ -3,6 +3,8 @@ SBDK configuration management
 """
 
 import json
+import os
+import uuid
 from pathlib import Path
 
 from pydantic import BaseModel, Field
@@ -36,20 +38,28 @@ class SBDKConfig(BaseModel):
         """Load configuration from JSON file"""
         config_file = Path(config_path)
 
-        if not config_file.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
-
-        with open(config_file) as f:
-            config_data = json.load(f)
+        try:
+            with open(config_file) as f:
+                config_data = json.load(f)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {config_path}") from None
 
         return cls(**config_data)
 
     def save_to_file(self, config_path: str = "sbdk_config.json") -> None:
         """Save configuration to JSON file"""
         config_file = Path(config_path)
-
-        with open(config_file, "w") as f:
-            json.dump(self.model_dump(), f, indent=2)
+        # Write to a uniquely named sibling temp file and swap it in so readers
+        # never see a partially written config
+        tmp_file = config_file.with_name(f"{config_file.name}.{uuid.uuid4().hex}.tmp")
+
+        try:
+            with open(tmp_file, "x") as f:
+                json.dump(self.model_dump(), f, indent=2)
+            os.replace(tmp_file, config_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
 
     def get_duckdb_path(self) -> Path:
         """Get resolved DuckDB path"""
@@ -9,6 +9,9 @@ from typing import Any, Optional
 
 from sbdk.core.config import SBDKConfig
 
+# Pipeline modules shipped with the project template, in execution order
+DEFAULT_PIPELINES = ("users", "events", "orders")
+
 
 class SBDKProject:
     """SBDK project manager"""
@@ -75,7 +78,7 @@ class SBDKProject:
     def run_pipelines(self, pipeline_names: Optional[list[str]] = None) -> bool:
         """Run DLT pipelines"""
         if pipeline_names is None:
-            pipeline_names = ["users", "events", "orders"]
+            pipeline_names = list(DEFAULT_PIPELINES)
 
         pipelines_path = self.config.get_pipelines_path()
 
@@ -65,7 +65,21 @@ def generate_events_data(num_events: int = None, max_user_id: int = None) -> lis
     for utm, weight in utm_sources:
         weighted_utm.extend([utm] * weight)
 
-    for _i in range(1, num_events + 1):
+    # Draw categorical columns in bulk rather than one Faker call per row
+    event_type_column = random.choices(weighted_events, k=num_events)
+    utm_source_column = random.choices(weighted_utm, k=num_events)
+    utm_medium_column = random.choices(
+        ("cpc", "organic", "email", "social", "referral"), k=num_events
+    )
+    device_type_column = random.choices(("desktop", "mobile", "tablet"), k=num_events)
+    browser_column = random.choices(
+        ("Chrome", "Firefox", "Safari", "Edge", "Opera"), k=num_events
+    )
+    os_column = random.choices(
+        ("Windows", "macOS", "Linux", "iOS", "Android"), k=num_events
+    )
+
+    for i in range(num_events):
         # Random user (some users are more active)
         if random.random() < 0.3:  # 30% of events from power users (first 20% of users)
             user_id = random.randint(1, max_user_id // 5)
@@ -73,7 +87,7 @@ def generate_events_data(num_events: int = None, max_user_id: int = None) -> lis
             user_id = random.randint(1, max_user_id)
 
         event_time = fake.date_time_between(start_date="-90d", end_date="now")
-        event_type = random.choice(weighted_events)
+        event_type = event_type_column[i]
 
         event = {
             "event_id": str(uuid.uuid4()),
@@ -83,25 +97,17 @@ def generate_events_data(num_events: int = None, max_user_id: int = None) -> lis
             ),  # 10% have session tracking
             "event_type": event_type,
             "timestamp": event_time,
-            "utm_source": random.choice(weighted_utm),
-            "utm_medium": fake.random_element(
-                elements=("cpc", "organic", "email", "social", "referral")
-            ),
+            "utm_source": utm_source_column[i],
+            "utm_medium": utm_medium_column[i],
             "utm_campaign": fake.catch_phrase() if random.random() < 0.3 else None,
             "page_url": fake.url(),
             "referrer_url": fake.url() if random.random() < 0.7 else None,
             "user_agent": fake.user_agent(),
             "ip_address": fake.ipv4(),
             "country": fake.country_code(),
-            "device_type": fake.random_element(
-                elements=("desktop", "mobile", "tablet")
-            ),
-            "browser": fake.random_element(
-                elements=("Chrome", "Firefox", "Safari", "Edge", "Opera")
-            ),
-            "os": fake.random_element(
-                elements=("Windows", "macOS", "Linux", "iOS", "Android")
-            ),
+            "device_type": device_type_column[i],
+            "browser": browser_column[i],
+            "os": os_column[i],
             "screen_resolution": f"{random.choice([1920, 1366, 1536, 1440, 1024])}x{random.choice([1080, 768, 864, 900, 768])}",
             "is_mobile": fake.boolean(chance_of_getting_true=45),
             "duration_seconds": (
@@ -172,7 +178,7 @@ def run():
     top_events = con.execute(
         """
         SELECT event_type, COUNT(*) as count,
-               ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM raw_events), 1) as percentage
+               ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER (), 1) as percentage
         FROM raw_events
         GROUP BY event_type
         ORDER BY count DESC
@@ -64,6 +64,22 @@ def generate_orders_data(num_orders: int = 20000, max_user_id: int = 10000) -> l
     for status, weight in order_statuses:
         weighted_statuses.extend([status] * weight)
 
+    # Draw categorical columns in bulk rather than one call per row; order
+    # timing is weighted towards recent days
+    days_ago_column = random.choices(
+        range(1, 366), weights=range(365, 0, -1), k=num_orders
+    )
+    category_column = random.choices(list(product_categories), k=num_orders)
+    status_column = random.choices(weighted_statuses, k=num_orders)
+    payment_column = random.choices(weighted_payments, k=num_orders)
+    currency_column = random.choices(("USD", "EUR", "GBP", "CAD", "AUD"), k=num_orders)
+    processor_column = random.choices(
+        ("stripe", "paypal", "square", "braintree"), k=num_orders
+    )
+    utm_source_column = random.choices(
+        ("google", "facebook", "direct", "email", "affiliate"), k=num_orders
+    )
+
     for i in range(1, num_orders + 1):
         # Some users make multiple orders
         if random.random() < 0.4:  # 40% repeat customers
@@ -72,13 +88,11 @@ def generate_orders_data(num_orders: int = 20000, max_user_id: int = 10000) -> l
             user_id = random.randint(1, max_user_id)
 
         # Order timing - more recent orders weighted higher
-        days_ago = random.choices(
-            range(1, 366), weights=[366 - i for i in range(1, 366)], k=1
-        )[0]
+        days_ago = days_ago_column[i - 1]
         order_date = fake.date_time_between(start_date=f"-{days_ago}d", end_date="now")
 
         # Select product category and calculate amount
-        category = random.choice(list(product_categories.keys()))
+        category = category_column[i - 1]
         min_price, max_price = product_categories[category]
         base_amount = round(random.uniform(min_price, max_price), 2)
 
@@ -94,7 +108,7 @@ def generate_orders_data(num_orders: int = 20000, max_user_id: int = 10000) -> l
         total_amount = subtotal + tax_amount
 
         # Order status affects completion date
-        status = random.choice(weighted_statuses)
+        status = status_column[i - 1]
         if status == "completed":
             completed_at = order_date + timedelta(hours=random.randint(1, 72))
         else:
@@ -118,13 +132,9 @@ def generate_orders_data(num_orders: int = 20000, max_user_id: int = 10000) -> l
             "discount_code": fake.lexify("????##") if discount_rate > 0 else None,
             "tax_amount": round(tax_amount, 2),
             "total_amount": round(total_amount, 2),
-            "currency": fake.random_element(
-                elements=("USD", "EUR", "GBP", "CAD", "AUD")
-            ),
-            "payment_method": random.choice(weighted_payments),
-            "payment_processor": fake.random_element(
-                elements=("stripe", "paypal", "square", "braintree")
-            ),
+            "currency": currency_column[i - 1],
+            "payment_method": payment_column[i - 1],
+            "payment_processor": processor_column[i - 1],
             "billing_country": fake.country_code(),
             "billing_state": fake.state_abbr(),
             "billing_city": fake.city(),
@@ -135,9 +145,7 @@ def generate_orders_data(num_orders: int = 20000, max_user_id: int = 10000) -> l
                 if random.random() < 0.35
                 else None
             ),
-            "utm_source": fake.random_element(
-                elements=("google", "facebook", "direct", "email", "affiliate")
-            ),
+            "utm_source": utm_source_column[i - 1],
             "utm_campaign": fake.catch_phrase() if random.random() < 0.4 else None,
             "referral_code": fake.lexify("REF####") if random.random() < 0.15 else None,
             "customer_notes": (
@@ -0,0 +1,15 @@
+"""
+Shared pytest fixtures for the SBDK.dev test suite
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for testing"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
@@ -109,22 +109,19 @@ class TestCLIInit:
 class TestCLIDev:
     """Test development mode functionality"""
 
-    def test_load_config_success(self):
+    def test_load_config_success(self, tmp_path):
         """Test successful config loading"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            test_config = {
-                "project": "test",
-                "duckdb_path": "test.duckdb",
-                "dbt_path": "./dbt",
-                "profiles_dir": "~/.dbt",
-            }
-            json.dump(test_config, f)
-            f.flush()
-
-            config = load_config(f.name)
-            assert config == test_config
+        test_config = {
+            "project": "test",
+            "duckdb_path": "test.duckdb",
+            "dbt_path": "./dbt",
+            "profiles_dir": "~/.dbt",
+        }
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(test_config))
 
-            os.unlink(f.name)
+        config = load_config(str(config_path))
+        assert config == test_config
 
     def test_load_config_missing_file(self):
         """Test config loading with missing file"""
@@ -421,7 +418,7 @@ class TestPerformance:
         assert startup_time < 2.0  # Should start in under 2 seconds
         assert result.exit_code == 0
 
-    def test_config_loading_performance(self):
+    def test_config_loading_performance(self, tmp_path):
         """Test config loading performance with large configs"""
         import time
 
@@ -436,19 +433,16 @@ class TestPerformance:
             "large_data": ["item"] * 1000,  # Add some bulk
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(large_config, f)
-            f.flush()
-
-            start_time = time.time()
-            config = load_config(f.name)
-            end_time = time.time()
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(large_config))
 
-            load_time = end_time - start_time
-            assert load_time < 0.5  # Should load in under 500ms
-            assert config["project"] == "perf_test"
+        start_time = time.time()
+        config = load_config(str(config_path))
+        end_time = time.time()
 
-            os.unlink(f.name)
+        load_time = end_time - start_time
+        assert load_time < 0.5  # Should load in under 500ms
+        assert config["project"] == "perf_test"
 
 
 # Security Testing
@@ -87,31 +87,22 @@ class TestInitCommandComprehensive:
 class TestDevCommandComprehensive:
     """Comprehensive tests for dev command"""
 
-    def test_load_config_with_custom_path(self):
+    def test_load_config_with_custom_path(self, tmp_path):
         """Test config loading with custom path"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            config_data = {"project": "custom", "target": "dev"}
-            json.dump(config_data, f)
-            f.flush()
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"project": "custom", "target": "dev"}))
 
-            try:
-                config = load_config(f.name)
-                assert config["project"] == "custom"
-                assert config["target"] == "dev"
-            finally:
-                os.unlink(f.name)
+        config = load_config(str(config_path))
+        assert config["project"] == "custom"
+        assert config["target"] == "dev"
 
-    def test_load_config_invalid_json(self):
+    def test_load_config_invalid_json(self, tmp_path):
         """Test config loading with invalid JSON"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("{ invalid json }")
-            f.flush()
+        config_path = tmp_path / "config.json"
+        config_path.write_text("{ invalid json }")
 
-            try:
-                with pytest.raises((json.JSONDecodeError, typer.Exit)):
-                    load_config(f.name)
-            finally:
-                os.unlink(f.name)
+        with pytest.raises((json.JSONDecodeError, typer.Exit)):
+            load_config(str(config_path))
 
     @patch("subprocess.run")
     def test_run_pipeline_module_with_args(self, mock_run):
@@ -359,30 +350,26 @@ class TestEdgeCasesAndErrorHandling:
 class TestPerformanceAndScalability:
     """Test performance characteristics"""
 
-    def test_large_config_loading(self):
+    def test_large_config_loading(self, tmp_path):
         """Test loading large configuration files"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            # Create large config
-            large_config = {
-                "project": "perf_test",
-                "data": ["item"] * 10000,  # Large data array
-                "nested": {f"key_{i}": f"value_{i}" for i in range(1000)},
-            }
-            json.dump(large_config, f)
-            f.flush()
+        # Create large config
+        large_config = {
+            "project": "perf_test",
+            "data": ["item"] * 10000,  # Large data array
+            "nested": {f"key_{i}": f"value_{i}" for i in range(1000)},
+        }
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(large_config))
 
-            try:
-                import time
+        import time
 
-                start_time = time.time()
-                config = load_config(f.name)
-                end_time = time.time()
+        start_time = time.time()
+        config = load_config(str(config_path))
+        end_time = time.time()
 
-                # Should load reasonably quickly
-                assert end_time - start_time < 1.0  # Less than 1 second
-                assert config["project"] == "perf_test"
-            finally:
-                os.unlink(f.name)
+        # Should load reasonably quickly
+        assert end_time - start_time < 1.0  # Less than 1 second
+        assert config["project"] == "perf_test"
 
     def test_multiple_project_creation(self):
         """Test creating multiple projects"""
@@ -415,28 +402,24 @@ class TestSecurityAndValidation:
                 # Should handle safely (may succeed or fail gracefully)
                 assert result.exit_code in [0, 1]
 
-    def test_config_sanitization(self):
+    def test_config_sanitization(self, tmp_path):
         """Test configuration value sanitization"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            # Config with potentially dangerous values
-            config = {
-                "project": "test",
-                "command": "rm -rf /",  # Dangerous command
-                "script": "<script>alert('xss')</script>",  # XSS attempt
-                "path": "../../etc/passwd",  # Path traversal attempt
-            }
-            json.dump(config, f)
-            f.flush()
-
-            try:
-                loaded_config = load_config(f.name)
-
-                # Values should be loaded as strings, not executed
-                assert loaded_config["command"] == "rm -rf /"
-                assert loaded_config["script"] == "<script>alert('xss')</script>"
-                assert loaded_config["path"] == "../../etc/passwd"
-            finally:
-                os.unlink(f.name)
+        # Config with potentially dangerous values
+        config = {
+            "project": "test",
+            "command": "rm -rf /",  # Dangerous command
+            "script": "<script>alert('xss')</script>",  # XSS attempt
+            "path": "../../etc/passwd",  # Path traversal attempt
+        }
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(config))
+
+        loaded_config = load_config(str(config_path))
+
+        # Values should be loaded as strings, not executed
+        assert loaded_config["command"] == "rm -rf /"
+        assert loaded_config["script"] == "<script>alert('xss')</script>"
+        assert loaded_config["path"] == "../../etc/passwd"
 
 
 if __name__ == "__main__":
@@ -94,10 +94,10 @@ class TestDBTIntegration:
                 # Contains Jinja templating - good
                 pass
 
-    def test_dbt_profiles_generation(self):
+    def test_dbt_profiles_generation(self, monkeypatch):
         """Test dbt profiles are generated correctly"""
         with tempfile.TemporaryDirectory() as temp_dir:
-            os.chdir(temp_dir)
+            monkeypatch.chdir(temp_dir)
 
             # Mock home directory for profiles
             with patch("pathlib.Path.home", return_value=Path(temp_dir)):
@@ -122,13 +122,13 @@ class TestDBTExecution:
     """Test dbt command execution"""
 
     @patch("subprocess.run")
-    def test_dbt_run_command(self, mock_run):
+    def test_dbt_run_command(self, mock_run, monkeypatch):
         """Test dbt run command execution"""
         # Mock successful dbt run
         mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            os.chdir(temp_dir)
+            monkeypatch.chdir(temp_dir)
 
             # Create test config
             config = {
@@ -163,13 +163,13 @@ class TestDBTExecution:
             assert test_called, "dbt test should have been called"
 
     @patch("subprocess.run")
-    def test_dbt_test_command(self, mock_run):
+    def test_dbt_test_command(self, mock_run, monkeypatch):
         """Test dbt test command execution"""
         # Mock successful dbt test
         mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            os.chdir(temp_dir)
+            monkeypatch.chdir(temp_dir)
 
             config = {
                 "project": "test_dbt",
@@ -187,7 +187,7 @@ class TestDBTExecution:
             assert result.exit_code == 0
 
     @patch("subprocess.run")
-    def test_dbt_error_handling(self, mock_run):
+    def test_dbt_error_handling(self, mock_run, monkeypatch):
         """Test dbt error handling"""
         # Mock failed dbt command
         error = subprocess.CalledProcessError(1, "dbt")
@@ -196,7 +196,7 @@ class TestDBTExecution:
         mock_run.side_effect = error
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            os.chdir(temp_dir)
+            monkeypatch.chdir(temp_dir)
 
             config = {
                 "project": "test_dbt_error",
@@ -219,10 +219,10 @@ class TestDBTExecution:
 class TestDataTransformations:
     """Test actual data transformations with dbt"""
 
-    def test_dbt_with_sample_data(self):
+    def test_dbt_with_sample_data(self, monkeypatch):
         """Test dbt transformations with sample data"""
         with tempfile.TemporaryDirectory() as temp_dir:
-            os.chdir(temp_dir)
+            monkeypatch.chdir(temp_dir)
 
             # Create a temporary DuckDB with sample data
             db_path = "test_sample.duckdb"
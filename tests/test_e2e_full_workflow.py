@@ -11,6 +11,9 @@ import time
 from pathlib import Path
 
 import pytest
+from typer.testing import CliRunner
+
+from sbdk.cli.main import app
 
 
 class TestFullE2EWorkflow:
@@ -112,19 +115,16 @@ sbdk_project:
             assert "Starting visual interface..." in stdout
             assert "Visual interface failed" not in stdout
 
-    def test_dbt_profile_path_resolution(self):
+    def test_dbt_profile_path_resolution(self, monkeypatch):
         """Test that dbt profiles are correctly resolved"""
         with tempfile.TemporaryDirectory() as temp_dir:
             project_name = "dbt_test_project"
             project_path = Path(temp_dir) / project_name
 
-            # Initialize project
-            subprocess.run(
-                [sys.executable, "-m", "sbdk.cli.main", "init", project_name],
-                cwd=temp_dir,
-                capture_output=True,
-                text=True,
-            )
+            # Initialize project in-process; only the scaffold matters here
+            monkeypatch.chdir(temp_dir)
+            result = CliRunner().invoke(app, ["init", project_name])
+            assert result.exit_code == 0, f"Init failed: {result.stdout}"
 
             # Check dbt project configuration
             dbt_project_yml = project_path / "dbt" / "dbt_project.yml"
@@ -165,8 +165,7 @@ if __name__ == "__main__":
                 text=True,
             )
 
-            print(f"Test pipeline output: {result.stdout}")
-            assert result.returncode == 0
+            assert result.returncode == 0, f"Test pipeline output: {result.stderr}"
 
 
 if __name__ == "__main__":
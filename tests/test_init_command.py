@@ -3,7 +3,6 @@ Test the sbdk init command functionality
 """
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -12,13 +11,6 @@ from typer.testing import CliRunner
 from sbdk.cli.main import app
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
-
 @pytest.fixture
 def runner():
     """Create a CLI runner"""
@@ -84,6 +76,22 @@ def test_init_updates_dbt_project_yml(runner, temp_dir):
         assert f"models:\n  {project_name}:" in content
 
 
+def test_init_dbt_project_name_containing_template_name(runner, temp_dir):
+    """Test that a project name containing the template name is not re-substituted"""
+    project_name = "sbdk_project_demo"
+
+    with runner.isolated_filesystem():
+        result = runner.invoke(app, ["init", project_name])
+        assert result.exit_code == 0
+
+        dbt_project_path = Path(project_name) / "dbt" / "dbt_project.yml"
+        content = dbt_project_path.read_text()
+
+        assert f"name: '{project_name}'" in content
+        assert f"profile: '{project_name}'" in content
+        assert f"{project_name}_demo" not in content
+
+
 def test_init_creates_dbt_profile(runner, temp_dir):
     """Test that init creates correct dbt profile"""
     project_name = "analytics_pipeline"
@@ -3,6 +3,7 @@ Interactive CLI Flow Tests for SBDK.dev
 Tests user interaction flows, prompts, and real-world usage scenarios
 """
 
+import json
 import os
 import tempfile
 import time
@@ -480,5 +481,24 @@ class TestAccessibilityAndUsability:
                 assert has_progress, "Long operation should show progress"
 
 
+
+class TestProjectStatus:
+    """Test project status reporting in the interactive CLI"""
+
+    def test_database_under_file_reported_missing(self, tmp_path):
+        """Test a duckdb_path whose parent is a file reports a missing database"""
+        from sbdk.cli.interactive import SBDKInteractive
+
+        (tmp_path / "data").write_text("")
+        (tmp_path / "sbdk_config.json").write_text(
+            json.dumps({"duckdb_path": "data/dev.duckdb"})
+        )
+
+        status = SBDKInteractive(str(tmp_path))._get_project_status()
+
+        assert status["database"]["exists"] is False
+        assert status["database"]["size"] == "0 MB"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
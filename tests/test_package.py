@@ -4,6 +4,8 @@ Basic package tests
 
 from pathlib import Path
 
+import pytest
+
 
 def test_package_imports():
     """Test that main package imports work"""
@@ -56,6 +58,36 @@ def test_config_validation():
     assert isinstance(pipelines_path, Path)
 
 
+def test_config_save_round_trip(tmp_path):
+    """Test saving config replaces the file without leaving a temp file behind"""
+    from sbdk.core.config import SBDKConfig
+
+    config_path = tmp_path / "sbdk_config.json"
+    config_path.write_text("{}")
+    config = SBDKConfig(project="test_project", duckdb_path="data/test.duckdb")
+
+    config.save_to_file(str(config_path))
+
+    assert SBDKConfig.load_from_file(str(config_path)) == config
+    assert [p.name for p in tmp_path.iterdir()] == ["sbdk_config.json"]
+
+
+def test_config_save_failure_keeps_original(tmp_path):
+    """Test a failed save leaves the existing config and no temp file"""
+    from sbdk.core.config import SBDKConfig
+
+    config_path = tmp_path / "sbdk_config.json"
+    config_path.write_text("{}")
+    config = SBDKConfig(project="test_project", duckdb_path="data/test.duckdb")
+    config.watch_paths.append(object())  # not JSON serializable
+
+    with pytest.raises(TypeError):
+        config.save_to_file(str(config_path))
+
+    assert config_path.read_text() == "{}"
+    assert [p.name for p in tmp_path.iterdir()] == ["sbdk_config.json"]
+
+
 def test_package_structure():
     """Test that required package files exist"""
     import sbdk
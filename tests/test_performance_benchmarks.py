@@ -130,80 +130,74 @@ class TestCLIPerformance:
 class TestDataGenerationPerformance:
     """Test data generation performance"""
 
-    def test_users_generation_scalability(self):
+    @pytest.mark.parametrize("scale", [100, 1000, 5000, 10000])
+    def test_users_generation_scalability(self, scale):
         """Test user data generation at different scales"""
-        scales = [100, 1000, 5000, 10000]
-
-        for scale in scales:
-            metrics = PerformanceMetrics()
+        metrics = PerformanceMetrics()
 
-            metrics.start()
-            users = generate_users_data(scale)
-            metrics.stop()
+        metrics.start()
+        users = generate_users_data(scale)
+        metrics.stop()
 
-            assert len(users) == scale
+        assert len(users) == scale
 
-            # Performance expectations
-            if scale <= 1000:
-                assert metrics.execution_time < 1.0
-            elif scale <= 5000:
-                assert metrics.execution_time < 3.0
-            else:
-                assert metrics.execution_time < 10.0
+        # Performance expectations
+        if scale <= 1000:
+            assert metrics.execution_time < 1.0
+        elif scale <= 5000:
+            assert metrics.execution_time < 3.0
+        else:
+            assert metrics.execution_time < 10.0
 
-            print(
-                f"Generated {scale} users in {metrics.execution_time:.3f}s ({scale/metrics.execution_time:.0f} users/sec)"
-            )
+        print(
+            f"Generated {scale} users in {metrics.execution_time:.3f}s ({scale/metrics.execution_time:.0f} users/sec)"
+        )
 
-    def test_events_generation_scalability(self):
+    @pytest.mark.parametrize("scale", [1000, 5000, 10000, 50000])
+    def test_events_generation_scalability(self, scale):
         """Test event data generation at different scales"""
-        scales = [1000, 5000, 10000, 50000]
-
-        for scale in scales:
-            metrics = PerformanceMetrics()
+        metrics = PerformanceMetrics()
 
-            metrics.start()
-            events = generate_events_data(scale, max_user_id=1000)
-            metrics.stop()
+        metrics.start()
+        events = generate_events_data(scale, max_user_id=1000)
+        metrics.stop()
 
-            assert len(events) == scale
+        assert len(events) == scale
 
-            # Performance expectations
-            if scale <= 5000:
-                assert metrics.execution_time < 2.0
-            elif scale <= 10000:
-                assert metrics.execution_time < 5.0
-            else:
-                assert metrics.execution_time < 30.0  # Increased timeout for CI
+        # Performance expectations
+        if scale <= 5000:
+            assert metrics.execution_time < 2.0
+        elif scale <= 10000:
+            assert metrics.execution_time < 5.0
+        else:
+            assert metrics.execution_time < 30.0  # Increased timeout for CI
 
-            print(
-                f"Generated {scale} events in {metrics.execution_time:.3f}s ({scale/metrics.execution_time:.0f} events/sec)"
-            )
+        print(
+            f"Generated {scale} events in {metrics.execution_time:.3f}s ({scale/metrics.execution_time:.0f} events/sec)"
+        )
 
-    def test_orders_generation_scalability(self):
+    @pytest.mark.parametrize("scale", [500, 2000, 5000, 10000])
+    def test_orders_generation_scalability(self, scale):
         """Test order data generation at different scales"""
-        scales = [500, 2000, 5000, 10000]
-
-        for scale in scales:
-            metrics = PerformanceMetrics()
+        metrics = PerformanceMetrics()
 
-            metrics.start()
-            orders = generate_orders_data(scale, max_user_id=1000)
-            metrics.stop()
+        metrics.start()
+        orders = generate_orders_data(scale, max_user_id=1000)
+        metrics.stop()
 
-            assert len(orders) == scale
+        assert len(orders) == scale
 
-            # Performance expectations
-            if scale <= 2000:
-                assert metrics.execution_time < 1.0
-            elif scale <= 5000:
-                assert metrics.execution_time < 3.0
-            else:
-                assert metrics.execution_time < 8.0
+        # Performance expectations
+        if scale <= 2000:
+            assert metrics.execution_time < 1.0
+        elif scale <= 5000:
+            assert metrics.execution_time < 3.0
+        else:
+            assert metrics.execution_time < 8.0
 
-            print(
-                f"Generated {scale} orders in {metrics.execution_time:.3f}s ({scale/metrics.execution_time:.0f} orders/sec)"
-            )
+        print(
+            f"Generated {scale} orders in {metrics.execution_time:.3f}s ({scale/metrics.execution_time:.0f} orders/sec)"
+        )
 
 
 @pytest.mark.performance
@@ -227,7 +221,7 @@ class TestDatabasePerformance:
 
             # Test large data insertion
             large_dataset = generate_users_data(10000)
-            pd.DataFrame(large_dataset)
+            con.register("df", pd.DataFrame(large_dataset))
 
             metrics.start()
             con.execute("CREATE TABLE users AS SELECT * FROM df")
@@ -256,8 +250,8 @@ class TestDatabasePerformance:
             users = generate_users_data(50000)
             events = generate_events_data(200000, max_user_id=50000)
 
-            pd.DataFrame(users)
-            pd.DataFrame(events)
+            con.register("users_df", pd.DataFrame(users))
+            con.register("events_df", pd.DataFrame(events))
 
             con.execute("CREATE TABLE users AS SELECT * FROM users_df")
             con.execute("CREATE TABLE events AS SELECT * FROM events_df")
@@ -530,7 +524,7 @@ class TestScalabilityLimits:
 
             for batch in range(max_batches):
                 users = generate_users_data(batch_size)
-                pd.DataFrame(users)
+                con.register("df", pd.DataFrame(users))
 
                 if batch == 0:
                     con.execute("CREATE TABLE scale_users AS SELECT * FROM df")
@@ -7,6 +7,25 @@ import os
 import duckdb
 import pytest
 
+# Allowed values for categorical columns produced by the pipeline templates
+VALID_SUBSCRIPTION_TIERS = frozenset({"free", "basic", "premium", "enterprise"})
+VALID_EVENT_TYPES = frozenset(
+    {
+        "page_view",
+        "click",
+        "scroll",
+        "signup",
+        "login",
+        "logout",
+        "purchase",
+        "add_to_cart",
+        "search",
+    }
+)
+VALID_ORDER_STATUSES = frozenset(
+    {"completed", "pending", "cancelled", "refunded", "failed"}
+)
+
 
 def safe_getcwd():
     """Get current working directory safely"""
@@ -27,17 +46,9 @@ def safe_chdir(path):
 
 # Test fixtures
 @pytest.fixture
-def test_db_path():
-    """Create a temporary test database"""
-    return "test_data.duckdb"
-
-
-@pytest.fixture(autouse=True)
-def cleanup_test_db(test_db_path):
-    """Clean up test database after each test"""
-    yield
-    if os.path.exists(test_db_path):
-        os.remove(test_db_path)
+def test_db_path(tmp_path):
+    """Create a temporary test database path, removed along with tmp_path"""
+    return str(tmp_path / "test_data.duckdb")
 
 
 def test_users_pipeline():
@@ -56,10 +67,7 @@ def test_users_pipeline():
     # Validate data types
     assert all(isinstance(user["user_id"], int) for user in users)
     assert all("@" in user["email"] for user in users)
-    assert all(
-        user["subscription_tier"] in ["free", "basic", "premium", "enterprise"]
-        for user in users
-    )
+    assert all(user["subscription_tier"] in VALID_SUBSCRIPTION_TIERS for user in users)
 
 
 def test_events_pipeline():
@@ -80,18 +88,7 @@ def test_events_pipeline():
     assert all(1 <= event["user_id"] <= 100 for event in events)
 
     # Validate event types
-    valid_events = [
-        "page_view",
-        "click",
-        "scroll",
-        "signup",
-        "login",
-        "logout",
-        "purchase",
-        "add_to_cart",
-        "search",
-    ]
-    assert all(event["event_type"] in valid_events for event in events)
+    assert all(event["event_type"] in VALID_EVENT_TYPES for event in events)
 
 
 def test_orders_pipeline():
@@ -112,41 +109,69 @@ def test_orders_pipeline():
     assert all(order["total_amount"] > 0 for order in orders)
 
     # Validate status values
-    valid_statuses = ["completed", "pending", "cancelled", "refunded", "failed"]
-    assert all(order["status"] in valid_statuses for order in orders)
+    assert all(order["status"] in VALID_ORDER_STATUSES for order in orders)
+
+
+def test_orders_payment_distribution_uses_all_orders(tmp_path, monkeypatch, capsys):
+    """Test payment percentages are relative to all orders, not just completed"""
+    import json
+
+    from sbdk.templates.pipelines import orders
+
+    rows = orders.generate_orders_data(5, max_user_id=10)
+    for row, (method, status) in zip(
+        rows,
+        [
+            ("credit_card", "completed"),
+            ("credit_card", "pending"),
+            ("paypal", "pending"),
+            ("paypal", "pending"),
+            ("crypto", "completed"),
+        ],
+    ):
+        row["payment_method"] = method
+        row["status"] = status
+
+    (tmp_path / "sbdk_config.json").write_text(
+        json.dumps({"duckdb_path": str(tmp_path / "orders.duckdb")})
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(orders, "generate_orders_data", lambda: rows)
+
+    orders.run()
+
+    output = capsys.readouterr().out
+    assert "- credit_card: 1 orders (20.0%)" in output
+    assert "- crypto: 1 orders (20.0%)" in output
+    assert "- paypal:" not in output
 
 
 def test_database_creation(test_db_path):
     """Test that DuckDB database can be created and queried"""
-    import tempfile
-
     import pandas as pd
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        os.chdir(temp_dir)
-
-        # Create sample data
-        sample_data = [
-            {"id": 1, "name": "test1", "value": 100},
-            {"id": 2, "name": "test2", "value": 200},
-        ]
+    # Create sample data
+    sample_data = [
+        {"id": 1, "name": "test1", "value": 100},
+        {"id": 2, "name": "test2", "value": 200},
+    ]
 
-        pd.DataFrame(sample_data)
+    df = pd.DataFrame(sample_data)
 
-        # Create database and table with absolute path
-        db_path = os.path.join(temp_dir, test_db_path)
-        con = duckdb.connect(db_path)
-        con.execute("CREATE TABLE test_table AS SELECT * FROM df")
+    # Create database and table
+    con = duckdb.connect(test_db_path)
+    con.register("df", df)
+    con.execute("CREATE TABLE test_table AS SELECT * FROM df")
 
-        # Query data
-        result = con.execute("SELECT COUNT(*) FROM test_table").fetchone()
-        assert result[0] == 2
+    # Query data
+    result = con.execute("SELECT COUNT(*) FROM test_table").fetchone()
+    assert result[0] == 2
 
-        # Query specific values
-        result = con.execute("SELECT SUM(value) FROM test_table").fetchone()
-        assert result[0] == 300
+    # Query specific values
+    result = con.execute("SELECT SUM(value) FROM test_table").fetchone()
+    assert result[0] == 300
 
-        con.close()
+    con.close()
 
 
 def test_pipeline_integration():
@@ -177,30 +202,24 @@ def test_pipeline_integration():
             safe_chdir(original_cwd)
 
 
-def test_cli_commands():
+def test_cli_commands(tmp_path):
     """Test CLI command functions"""
     import json
-    import tempfile
 
     from sbdk.cli.commands.run import load_config
 
     # Test config loading
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        test_config = {
-            "project": "test_project",
-            "target": "dev",
-            "duckdb_path": "test.duckdb",
-        }
-        json.dump(test_config, f)
-        f.flush()
-
-        # Test config loading
-        config = load_config(f.name)
-        assert config["project"] == "test_project"
-        assert config["target"] == "dev"
-
-        # Clean up
-        os.unlink(f.name)
+    test_config = {
+        "project": "test_project",
+        "target": "dev",
+        "duckdb_path": "test.duckdb",
+    }
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(test_config))
+
+    config = load_config(str(config_path))
+    assert config["project"] == "test_project"
+    assert config["target"] == "dev"
 
 
 if __name__ == "__main__":
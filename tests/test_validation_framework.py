@@ -280,9 +280,7 @@ class TestAutomatedValidation:
                 result.add_error(f"Expected 1000 users, got {len(users)}")
 
             # Validate data structure
-            if users and not all(
-                key in users[0] for key in ["user_id", "email", "created_at"]
-            ):
+            if users and not {"user_id", "email", "created_at"} <= users[0].keys():
                 result.add_error("Users data missing required fields")
 
         except Exception as e:
@@ -319,7 +317,7 @@ class TestAutomatedValidation:
 
                 # Test data insertion
                 test_data = [{"id": i, "value": f"test_{i}"} for i in range(1000)]
-                pd.DataFrame(test_data)
+                con.register("df", pd.DataFrame(test_data))
 
                 start_time = time.time()
                 con.execute("CREATE TABLE test_table AS SELECT * FROM df")
@@ -32,6 +32,7 @@ from sbdk.cli.visual_cli_robust import (
     FileWatcher,
     KeyboardHandler,
     TerminalRenderer,
+    _walk,
 )
 
 
@@ -193,12 +194,6 @@ class TestFastAPIClient:
 class TestFileWatcher:
     """Test file watching functionality"""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
-
     def test_file_watcher_initialization(self, temp_dir):
         """Test file watcher initializes correctly"""
         callback = Mock()
@@ -242,6 +237,55 @@ class TestFileWatcher:
         # Verify callback was called
         assert callback.called
 
+    def test_walk_finds_nested_files(self, temp_dir):
+        """Test directory walk yields files from nested directories"""
+        nested = temp_dir / "models" / "staging"
+        nested.mkdir(parents=True)
+        (temp_dir / "users.py").write_text("")
+        (nested / "stg_users.sql").write_text("")
+        (nested / "notes.md").write_text("")
+
+        found = {Path(p).name for p in _walk(str(temp_dir))}
+
+        assert found == {"users.py", "stg_users.sql", "notes.md"}
+
+    def test_walk_skips_dense_directories(self, temp_dir):
+        """Test directory walk prunes VCS, cache and dbt output directories"""
+        for skipped in (".git", "__pycache__", "target"):
+            (temp_dir / skipped).mkdir()
+            (temp_dir / skipped / "ignored.py").write_text("")
+        (temp_dir / "users.py").write_text("")
+
+        found = {Path(p).name for p in _walk(str(temp_dir))}
+
+        assert found == {"users.py"}
+
+    def test_walk_follows_file_symlinks_only(self, temp_dir):
+        """Test directory walk yields symlinked files but not symlinked dirs"""
+        source = temp_dir / "shared" / "users.py"
+        source.parent.mkdir()
+        source.write_text("")
+        pipelines = temp_dir / "pipelines"
+        pipelines.mkdir()
+        (pipelines / "users.py").symlink_to(source)
+        (pipelines / "loop").symlink_to(pipelines, target_is_directory=True)
+
+        found = list(_walk(str(pipelines)))
+
+        assert found == [str(pipelines / "users.py")]
+
+    def test_iter_watched_files_filters_suffixes(self, temp_dir):
+        """Test watcher only yields watched suffixes, or the path if a file"""
+        (temp_dir / "users.py").write_text("")
+        (temp_dir / "notes.md").write_text("")
+        watcher = FileWatcher([str(temp_dir)], Mock())
+
+        found = {Path(p).name for p in watcher._iter_watched_files(str(temp_dir))}
+        single = list(watcher._iter_watched_files(str(temp_dir / "notes.md")))
+
+        assert found == {"users.py"}
+        assert single == [str(temp_dir / "notes.md")]
+
 
 class TestKeyboardHandler:
     """Test keyboard input handling"""
@@ -597,11 +641,9 @@ class TestSBDKVisualIntegration:
         with tempfile.TemporaryDirectory() as temp_dir:
             project_path = Path(temp_dir)
 
-            # Create project structure
-            (project_path / "pipelines").mkdir()
-            (project_path / "dbt").mkdir()
-            (project_path / "dbt" / "models").mkdir()
-            (project_path / "data").mkdir()
+            # Create project structure (parents are created with the leaves)
+            for leaf in ("pipelines", "dbt/models", "data"):
+                (project_path / leaf).mkdir(parents=True)
 
             # Create config file
             config = {
@@ -716,12 +758,9 @@ class TestEndToEndIntegration:
         with tempfile.TemporaryDirectory() as temp_dir:
             project_path = Path(temp_dir)
 
-            # Create complete project structure
-            (project_path / "pipelines").mkdir()
-            (project_path / "dbt").mkdir()
-            (project_path / "dbt" / "models").mkdir()
-            (project_path / "data").mkdir()
-            (project_path / "fastapi_server").mkdir()
+            # Create complete project structure (parents are created with the leaves)
+            for leaf in ("pipelines", "dbt/models", "data", "fastapi_server"):
+                (project_path / leaf).mkdir(parents=True)
 
             # Create config
             config = {